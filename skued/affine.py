@@ -10,7 +10,11 @@ import math
 import numpy as np
 
 # standard basis
-e1, e2, e3 = np.eye(3)
+# This is shared by every call that defaults to the standard basis, and hence
+# must not be modified.
+_standard_basis = np.eye(3)
+_standard_basis.setflags(write=False)
+e1, e2, e3 = _standard_basis
 
 
 def affine_map(array):
@@ -69,15 +73,15 @@ def transform(matrix, array):
 						  rather of shape {matrix.shape}."
         )
 
-    matrix = affine_map(matrix)
     # Case of a vector (e.g. position vector):
+    # Rather than extending the vector to 4 dimensions, the linear part of the
+    # transformation is applied directly, followed by the translation (if any).
     if array.ndim == 1:
-        extended_vector = np.array([0, 0, 0, 1], dtype=array.dtype)
-        extended_vector[:3] = array
-        return np.dot(matrix, extended_vector)[:3]
-    else:
-        array = affine_map(array)
-    return np.dot(matrix, array)
+        if matrix.shape == (3, 3):
+            return np.dot(matrix, array)
+        return np.dot(matrix[:3, :3], array) + matrix[:3, 3]
+
+    return np.dot(affine_map(matrix), affine_map(array))
 
 
 def translation_matrix(direction):
@@ -98,7 +102,7 @@ def translation_matrix(direction):
     return matrix
 
 
-def change_of_basis(basis1, basis2=(e1, e2, e3)):
+def change_of_basis(basis1, basis2=_standard_basis):
     """
     Returns the matrix that goes from one basis to the other.
 
@@ -115,15 +119,25 @@ def change_of_basis(basis1, basis2=(e1, e2, e3)):
         Change-of-basis matrix that, applied to `basis`, will
         return `basis2`.
     """
-    # Calculate the transform that goes from basis 1 to standard basis
-    basis1 = [np.asarray(vector).reshape(3, 1) for vector in basis1]
-    basis1_to_standard = np.hstack(tuple(basis1))
+    # The transform that goes from basis1 to standard basis is the basis1 matrix.
+    basis1_to_standard = _basis_matrix(basis1)
+
+    # Common case of expressing basis1 in the standard basis: nothing else to do,
+    # except making sure that the result does not share memory with the input
+    if basis2 is _standard_basis:
+        return basis1_to_standard.copy()
 
-    # Calculate the transform that goes from standard basis to basis2
-    basis2 = [np.asarray(vector).reshape(3, 1) for vector in basis2]
-    standard_to_basis2 = np.linalg.inv(np.hstack(tuple(basis2)))
+    # The transform that goes from standard basis to basis2 is the inverse of
+    # the basis2 matrix; solving the linear system avoids forming it explicitly
+    return np.linalg.solve(_basis_matrix(basis2), basis1_to_standard)
 
-    return np.dot(standard_to_basis2, basis1_to_standard)
+
+def _basis_matrix(basis):
+    """Single (3,3) array whose columns are the vectors of ``basis``."""
+    matrix = np.asarray(basis, dtype=float)
+    if matrix.ndim == 0 or matrix.shape[0] != 3 or matrix.size != 9:
+        raise ValueError(f"Expected a basis of three vectors of shape (3,), but got an array of shape {matrix.shape}.")
+    return matrix.reshape(3, 3).T
 
 
 def is_basis(basis):
@@ -234,38 +248,40 @@ def translation_rotation_matrix(angle, axis, translation):
     return rmat
 
 
-def change_basis_mesh(xx, yy, zz, basis1, basis2):
+def change_basis_mesh(xx, yy, zz, basis1, basis2=_standard_basis):
     """
     Changes the basis of meshgrid arrays.
 
     Parameters
     ----------
     xx, yy, zz : ndarrays
-        Arrays of equal shape, such as produced by numpy.meshgrid.
+        Arrays of equal shape, such as produced by numpy.meshgrid. Arrays that broadcast
+        together, such as produced by numpy.ogrid, are also supported.
     basis1 : list of ndarrays, shape(3,)
         Basis of the mesh
-    basis2 : list of ndarrays, shape(3,)
-        Basis in which to express the mesh
+    basis2 : list of ndarrays, shape(3,), optional
+        Basis in which to express the mesh. By default, this is the standard basis
 
     Returns
     -------
     XX, YY, ZZ : `~numpy.ndarray`
+        Arrays of the broadcasted shape of `xx`, `yy`, and `zz`.
     """
-    # Build coordinate array row-wise
-    changed = np.empty(shape=(3, xx.size), dtype=float)
-    linearized = np.empty(shape=(3, xx.size), dtype=float)
-    linearized[0, :] = xx.ravel()
-    linearized[1, :] = yy.ravel()
-    linearized[2, :] = zz.ravel()
+    xx, yy, zz = map(np.asarray, (xx, yy, zz))
+    shape = np.broadcast(xx, yy, zz).shape
+
+    # Build coordinate array row-wise. Assigning to a reshaped view
+    # broadcasts sparse inputs without materializing dense copies first.
+    changed = np.empty(shape=(3,) + shape, dtype=float)
+    linearized = np.empty(shape=(3,) + shape, dtype=float)
+    linearized[0] = xx
+    linearized[1] = yy
+    linearized[2] = zz
 
     # Change the basis at each row
     COB = change_of_basis(basis1, basis2)
-    np.dot(COB, linearized, out=changed)
-    return (
-        changed[0, :].reshape(xx.shape),
-        changed[1, :].reshape(yy.shape),
-        changed[2, :].reshape(zz.shape),
-    )
+    np.dot(COB, linearized.reshape(3, -1), out=changed.reshape(3, -1))
+    return changed[0], changed[1], changed[2]
 
 
 def minimum_image_distance(xx, yy, zz, lattice):
@@ -284,7 +300,10 @@ def minimum_image_distance(xx, yy, zz, lattice):
     r : `~numpy.ndarray`
         Minimum image distance over the lattice
     """
-    COB = change_of_basis(np.eye(3), lattice)
+    # The change of basis back to the standard basis is the lattice matrix itself,
+    # so only one matrix inversion is required
+    lattice_matrix = _basis_matrix(lattice)
+    COB = np.linalg.inv(lattice_matrix)
     linearized = np.empty(shape=(3, xx.size), dtype=float)  # In the standard basis
     ulinearized = np.empty_like(linearized)  # In the unitcell basis
 
@@ -294,7 +313,11 @@ def minimum_image_distance(xx, yy, zz, lattice):
 
     # Go to unitcell basis, where the cell is cubic of side length 1
     np.dot(COB, linearized, out=ulinearized)
-    ulinearized -= np.rint(ulinearized)
-    np.dot(np.linalg.inv(COB), ulinearized, out=linearized)
-
-    return np.reshape(np.linalg.norm(linearized, axis=0), xx.shape)
+    # The standard-basis buffer is free at this point; reuse it to hold the rounded
+    # coordinates rather than allocating a temporary
+    np.rint(ulinearized, out=linearized)
+    ulinearized -= linearized
+    np.dot(lattice_matrix, ulinearized, out=linearized)
+
+    # Euclidean norm along the first axis, without the temporary squared array of np.linalg.norm
+    return np.reshape(np.sqrt(np.einsum("ij,ij->j", linearized, linearized)), xx.shape)
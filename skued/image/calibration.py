@@ -5,11 +5,6 @@ from ..eproperties import electron_wavelength
 from ..utils import suppress_warnings
 
 
-def hypot(*args):
-    """Generalized np.hypot"""
-    return np.sqrt(np.sum(np.square(args)))
-
-
 # TODO: test
 #       Not exporting this function until tests are written
 def calq(I, crystal, peak_indices, miller_indices):
@@ -114,7 +109,8 @@ def powder_calq(I, crystal, peak_indices, miller_indices):
         raise ValueError(f"Two peaks are required to calibrate, but received {len(peak_indices)}")
 
     # scattering vector length based on known structure
-    qs = [hypot(*crystal.scattering_vector(hkl)) for hkl in miller_indices]
+    # All reflections are converted at once, as a table of Miller indices
+    qs = np.linalg.norm(crystal.scattering_vector(np.asarray(miller_indices)), axis=1)
 
     # calibration is done by fitting a line
     # Expecting that I is defined on an
@@ -153,25 +149,21 @@ def detector_scattvectors(keV, camera_length, shape, pixel_size, center=None):
     if center is None:
         center = np.rint(np.array(shape) / 2)
 
-    # Grid of detector dimention in meters
+    # Extent of detector dimensions in meters
     cx, cy = center
-    extent_x = np.arange(0, shape[0]) - cx
-    extent_y = np.arange(0, shape[1]) - cy
-    xx, yy = np.meshgrid(pixel_size * extent_x, pixel_size * extent_y)
-
-    r, phi = np.sqrt(xx**2 + yy**2), np.arctan2(yy, xx)
-    angle = np.arctan(r / camera_length)  # Diffraction angle 2 theta
-
-    # Scattering vector norm parallel to the detector (inverse Angs)
-    q_norm_parallel = 4 * np.pi * np.sin(angle / 2) / electron_wavelength(keV=keV)
-    extent_kx, extent_ky = (
-        (q_norm_parallel * np.cos(phi))[0, :],
-        (q_norm_parallel * np.sin(phi))[:, 0],
-    )
+    extent_x = pixel_size * (np.arange(0, shape[0]) - cx)
+    extent_y = pixel_size * (np.arange(0, shape[1]) - cy)
+
+    # Only the first row and column of the detector are required to
+    # determine the extent of the reciprocal space grid; there is no need
+    # to compute scattering angles over a dense mesh of the whole detector.
+    wavelength = electron_wavelength(keV=keV)
+    extent_kx, _ = _parallel_scattvector(extent_x, extent_y[0], camera_length, wavelength)
+    _, extent_ky = _parallel_scattvector(extent_x[0], extent_y, camera_length, wavelength)
     qx, qy = np.meshgrid(extent_kx, extent_ky)
 
     # By our convention, we have |q| = 2*pi/wavelength
-    ewald_sphere_radius = 2 * np.pi / electron_wavelength(keV=keV)
+    ewald_sphere_radius = 2 * np.pi / wavelength
 
     # Warnings about invalid values in sqrt
     # The resulting NaNs are changed to zeroes
@@ -179,3 +171,16 @@ def detector_scattvectors(keV, camera_length, shape, pixel_size, center=None):
         qz = np.nan_to_num(np.sqrt(ewald_sphere_radius**2 - qx**2 - qy**2))
 
     return tuple(map(np.squeeze, (qx, qy, qz)))
+
+
+def _parallel_scattvector(x, y, camera_length, wavelength):
+    """
+    Components of the scattering vector parallel to the detector [:math:`Å^{-1}`]
+    at detector positions ``x`` and ``y`` [meters].
+    """
+    r, phi = np.hypot(x, y), np.arctan2(y, x)
+    angle = np.arctan(r / camera_length)  # Diffraction angle 2 theta
+
+    # Scattering vector norm parallel to the detector (inverse Angs)
+    q_norm_parallel = 4 * np.pi * np.sin(angle / 2) / wavelength
+    return q_norm_parallel * np.cos(phi), q_norm_parallel * np.sin(phi)
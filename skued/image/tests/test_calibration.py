@@ -21,13 +21,11 @@ def test_powder_calq_simulation():
     I = powdersim(c, s)
 
     peak1 = (2, 0, 0)
-    Gx1, Gy1, Gz1 = c.scattering_vector(peak1)
-    q1 = np.sqrt(Gx1**2 + Gy1**2 + Gz1**2)
+    q1 = np.linalg.norm(c.scattering_vector(peak1))
     arr_index1 = np.argmin(np.abs(q - q1))
 
     peak2 = (2, 2, 0)
-    Gx2, Gy2, Gz2 = c.scattering_vector(peak2)
-    q2 = np.sqrt(Gx2**2 + Gy2**2 + Gz2**2)
+    q2 = np.linalg.norm(c.scattering_vector(peak2))
     arr_index2 = np.argmin(np.abs(q - q2))
 
     calibrated = powder_calq(I, c, peak_indices=(arr_index1, arr_index2), miller_indices=(peak1, peak2))
@@ -46,18 +44,15 @@ def test_powder_calq_simulation_3_peaks():
     I = powdersim(c, s)
 
     peak1 = (2, 0, 0)
-    Gx1, Gy1, Gz1 = c.scattering_vector(peak1)
-    q1 = np.sqrt(Gx1**2 + Gy1**2 + Gz1**2)
+    q1 = np.linalg.norm(c.scattering_vector(peak1))
     arr_index1 = np.argmin(np.abs(q - q1))
 
     peak2 = (2, 2, 0)
-    Gx2, Gy2, Gz2 = c.scattering_vector(peak2)
-    q2 = np.sqrt(Gx2**2 + Gy2**2 + Gz2**2)
+    q2 = np.linalg.norm(c.scattering_vector(peak2))
     arr_index2 = np.argmin(np.abs(q - q2))
 
     peak3 = (3, 0, -2)
-    Gx2, Gy2, Gz2 = c.scattering_vector(peak3)
-    q3 = np.sqrt(Gx2**2 + Gy2**2 + Gz2**2)
+    q3 = np.linalg.norm(c.scattering_vector(peak3))
     arr_index3 = np.argmin(np.abs(q - q3))
 
     calibrated = powder_calq(
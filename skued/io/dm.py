@@ -75,29 +75,44 @@ def dmread(filepath):
 
 ### binary data reading functions ###
 
+# Pre-compiled binary formats, so that format strings are not parsed on every read
+_BYTE = struct.Struct(">b")
+_SHORT = struct.Struct(">h")
+_LONG = struct.Struct(">l")
+_LONGLONG = struct.Struct(">q")
+_CHAR = struct.Struct("c")
+_LE_SHORT = struct.Struct("<h")
+_LE_LONG = struct.Struct("<l")
+_LE_LONGLONG = struct.Struct("<q")
+_LE_USHORT = struct.Struct("<H")
+_LE_ULONG = struct.Struct("<L")
+_LE_ULONGLONG = struct.Struct("<Q")
+_LE_FLOAT = struct.Struct("<f")
+_LE_DOUBLE = struct.Struct("<d")
+
 
 def readByte(f):
     """Read 1 byte as integer in file f"""
     read_bytes = f.read(1)
-    return struct.unpack(">b", read_bytes)[0]
+    return _BYTE.unpack(read_bytes)[0]
 
 
 def readShort(f):
     """Read 2 bytes as BE integer in file f"""
     read_bytes = f.read(2)
-    return struct.unpack(">h", read_bytes)[0]
+    return _SHORT.unpack(read_bytes)[0]
 
 
 def readLong(f):
     """Read 4 bytes as BE integer in file f"""
     read_bytes = f.read(4)
-    return struct.unpack(">l", read_bytes)[0]
+    return _LONG.unpack(read_bytes)[0]
 
 
 def readLongLong(f):
     """Read 8 bytes as BE integer in file f"""
     read_bytes = f.read(8)
-    return struct.unpack(">q", read_bytes)[0]
+    return _LONGLONG.unpack(read_bytes)[0]
 
 
 def readBool(f):
@@ -109,62 +124,63 @@ def readBool(f):
 def readChar(f):
     """Read 1 byte as char in file f"""
     read_bytes = f.read(1)
-    return struct.unpack("c", read_bytes)[0]
+    return _CHAR.unpack(read_bytes)[0]
 
 
 def readString(f, len_=1):
     """Read len_ bytes as a string in file f"""
     read_bytes = f.read(len_)
-    str_fmt = ">" + str(len_) + "s"
-    return struct.unpack(str_fmt, read_bytes)[0]
+    if len(read_bytes) != len_:
+        raise struct.error(f"Expected {len_} bytes, but only {len(read_bytes)} could be read")
+    return read_bytes
 
 
 def readLEShort(f):
     """Read 2 bytes as *little endian* integer in file f"""
     read_bytes = f.read(2)
-    return struct.unpack("<h", read_bytes)[0]
+    return _LE_SHORT.unpack(read_bytes)[0]
 
 
 def readLELong(f):
     """Read 4 bytes as *little endian* integer in file f"""
     read_bytes = f.read(4)
-    return struct.unpack("<l", read_bytes)[0]
+    return _LE_LONG.unpack(read_bytes)[0]
 
 
 def readLELongLong(f):
     """Read 8 bytes as *little endian* integer in file f"""
     read_bytes = f.read(8)
-    return struct.unpack("<q", read_bytes)[0]
+    return _LE_LONGLONG.unpack(read_bytes)[0]
 
 
 def readLEUShort(f):
     """Read 2 bytes as *little endian* unsigned integer in file f"""
     read_bytes = f.read(2)
-    return struct.unpack("<H", read_bytes)[0]
+    return _LE_USHORT.unpack(read_bytes)[0]
 
 
 def readLEULong(f):
     """Read 4 bytes as *little endian* unsigned integer in file f"""
     read_bytes = f.read(4)
-    return struct.unpack("<L", read_bytes)[0]
+    return _LE_ULONG.unpack(read_bytes)[0]
 
 
 def readLEULongLong(f):
     """Read 8 bytes as *little endian* unsigned integer in file f"""
     read_bytes = f.read(8)
-    return struct.unpack("<Q", read_bytes)[0]
+    return _LE_ULONGLONG.unpack(read_bytes)[0]
 
 
 def readLEFloat(f):
     """Read 4 bytes as *little endian* float in file f"""
     read_bytes = f.read(4)
-    return struct.unpack("<f", read_bytes)[0]
+    return _LE_FLOAT.unpack(read_bytes)[0]
 
 
 def readLEDouble(f):
     """Read 8 bytes as *little endian* double in file f"""
     read_bytes = f.read(8)
-    return struct.unpack("<d", read_bytes)[0]
+    return _LE_DOUBLE.unpack(read_bytes)[0]
 
 
 ## constants for encoded data types ##
@@ -198,6 +214,22 @@ readFunc = {
     OCTET: readChar,  # difference with char???
 }
 
+# - association data type <--> size in bytes
+encodedTypeSize = {
+    0: 0,
+    BOOLEAN: 1,
+    CHAR: 1,
+    OCTET: 1,
+    SHORT: 2,
+    USHORT: 2,
+    LONG: 4,
+    ULONG: 4,
+    FLOAT: 4,
+    DOUBLE: 8,
+    LONGLONG: 8,
+    BELONGLONG: 8,
+}
+
 ## list of image DataTypes ##
 dataTypes = {
     0: "NULL_DATA",
@@ -240,6 +272,18 @@ dataTypes = {
     37: "LAST_DATA",
 }
 
+# - association image dataType <--> numpy dtype
+imageDtypes = {
+    1: numpy.dtype("<i2"),  # 16-bit LE signed integer
+    2: numpy.dtype("<f4"),  # 32-bit LE floating point
+    6: numpy.dtype("u1"),  # 8-bit unsigned integer
+    7: numpy.dtype("<i4"),  # 32-bit LE signed integer
+    9: numpy.dtype("i1"),  # 8-bit signed integer
+    10: numpy.dtype("<u2"),  # 16-bit LE unsigned integer
+    11: numpy.dtype("<u4"),  # 32-bit LE unsigned integer
+    14: numpy.dtype("u1"),  # binary
+}
+
 ## supported Data Types
 dT_supported = [1, 2, 6, 7, 9, 10, 11, 14]
 SUPPORTED_DATA_TYPES = {i: dataTypes[i] for i in dT_supported}
@@ -258,16 +302,10 @@ class DM3(object):
 
     ## utility functions
     def _makeGroupString(self):
-        tString = str(self._curGroupAtLevelX[0])
-        for i in range(1, self._curGroupLevel + 1):
-            tString += f".{self._curGroupAtLevelX[i]}"
-        return tString
+        return ".".join(map(str, self._curGroupAtLevelX[: self._curGroupLevel + 1]))
 
     def _makeGroupNameString(self):
-        tString = self._curGroupNameAtLevelX[0]
-        for i in range(1, self._curGroupLevel + 1):
-            tString += "." + str(self._curGroupNameAtLevelX[i])
-        return tString
+        return ".".join(map(str, self._curGroupNameAtLevelX[: self._curGroupLevel + 1]))
 
     def _readIntValue(self):
         if self._fileVersion == 4:
@@ -334,20 +372,8 @@ class DM3(object):
 
     def _encodedTypeSize(self, eT):
         # returns the size in bytes of the data type
-        if eT == 0:
-            width = 0
-        elif eT in (BOOLEAN, CHAR, OCTET):
-            width = 1
-        elif eT in (SHORT, USHORT):
-            width = 2
-        elif eT in (LONG, ULONG, FLOAT):
-            width = 4
-        elif eT in (DOUBLE, LONGLONG, BELONGLONG):
-            width = 8
-        else:
-            # returns -1 for unrecognised types
-            width = -1
-        return width
+        # returns -1 for unrecognised types
+        return encodedTypeSize.get(eT, -1)
 
     def _readAnyData(self):
         ## higher level function dispatching to handling data types
@@ -645,18 +671,6 @@ class DM3(object):
     def imagedata(self):
         """Extracts image data as numpy.array"""
 
-        # numpy dtype strings associated to the various image dataTypes
-        dT_str = {
-            1: "<i2",  # 16-bit LE signed integer
-            2: "<f4",  # 32-bit LE floating point
-            6: "u1",  # 8-bit unsigned integer
-            7: "<i4",  # 32-bit LE signed integer
-            9: "i1",  # 8-bit signed integer
-            10: "<u2",  # 16-bit LE unsigned integer
-            11: "<u4",  # 32-bit LE unsigned integer
-            14: "u1",  # binary
-        }
-
         # get relevant Tags
         tag_root = "root.ImageList.1"
         data_offset = int(self.tags["%s.ImageData.Data.Offset" % tag_root])
@@ -667,8 +681,8 @@ class DM3(object):
         im_depth = self._im_depth
 
         # check if image DataType is implemented, then read
-        if data_type in dT_str:
-            np_dt = numpy.dtype(dT_str[data_type])
+        if data_type in imageDtypes:
+            np_dt = imageDtypes[data_type]
             self._f.seek(data_offset)
             # - fetch image data
             rawdata = self._f.read(data_size)
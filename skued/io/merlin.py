@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import os
 from datetime import datetime
 
 import numpy as np
@@ -34,13 +35,22 @@ def mibheader(filepath, hoffset=0):
     Merlin Image Binary files can be composed of multiple images; in this case, the
     file is composed of alternating image headers and binary data.
     """
+    with open(filepath, "rb") as img_file:
+        return _read_header(img_file, hoffset=hoffset)
+
+
+def _read_header(img_file, hoffset=0):
+    """
+    Parse a Merlin Image Binary header from an open binary file. See ``mibheader`` for details.
+    The file position is left at the end of the header.
+    """
     # First step : read small part of the header
     # to get the offset
-    with open(filepath, "r+b") as img_file:
-        pre_header = img_file.read(20)
-        _, _, offset, *_ = pre_header.decode("ascii").split(",")
-        img_file.seek(hoffset)
-        header = img_file.read(int(offset))
+    img_file.seek(hoffset)
+    pre_header = img_file.read(20)
+    _, _, offset, *_ = pre_header.decode("ascii").split(",")
+    img_file.seek(hoffset)
+    header = img_file.read(int(offset))
 
     header_items = header.decode("ascii").split(",")
 
@@ -100,16 +110,15 @@ def imibread(filepath):
     """
     coffset = 0  # current image offset (header + data)
 
-    with open(filepath, "r+b") as binary:
+    with open(filepath, "rb") as binary:
         # Move to end of first image and check if there is another one
         # by reading one more byte after the image data
         # in the case of a single-image file, the next byte is b''
         while binary.read(1):
-            binary.seek(coffset)
-
             # Information for the current image's header
-            # these should not change from image to image
-            header = mibheader(filepath, hoffset=coffset)
+            # these should not change from image to image.
+            # The header is read from the file that is already open.
+            header = _read_header(binary, hoffset=coffset)
             size_x, size_y = header["shape"]
             im_dtype = header["dtype"]
 
@@ -135,11 +144,38 @@ def mibread(filepath):
         NumPy array of the Merlin Image Binary. In the case of multi-image files,
         images will be stacked along axis 2.
 
+    Raises
+    ------
+    ValueError : if the file does not contain a whole number of images, e.g. if it is truncated.
+
     See Also
     --------
     imibread : generate images contained in a MIB file.
+
+    Notes
+    -----
+    Only the first header is parsed. All images in a multi-image file must therefore share
+    the same header length, shape, and data type. Use `imibread` to read files where this
+    is not the case.
     """
+    # Every image in a file has the same header length and shape. Therefore,
+    # the file can be read in one go as a sequence of (header, image) records,
+    # rather than one image at a time.
+    header = mibheader(filepath)
+    size_x, size_y = header["shape"]
+    record = np.dtype([("header", np.void, header["offset"]), ("image", header["dtype"], (size_x, size_y))])
+
+    # np.fromfile silently drops an incomplete trailing record
+    filesize = os.path.getsize(filepath)
+    if filesize % record.itemsize != 0:
+        raise ValueError(
+            f"File {filepath} of {filesize} bytes does not contain a whole number of images of {record.itemsize} bytes."
+        )
+    images = np.fromfile(filepath, dtype=record)["image"]
+
+    # Images are stacked along axis 2, in a new contiguous array of native byte order
+    # so that the record buffer (including headers) is not kept alive.
     # Squeeze the resulting array so that single image array have shape (x, y)
     # and not (x, y, 1)
-    images = imibread(filepath)
-    return np.squeeze(np.dstack(tuple(images)))
+    stacked = np.ascontiguousarray(np.moveaxis(images, 0, -1), dtype=images.dtype.newbyteorder("="))
+    return np.squeeze(stacked)
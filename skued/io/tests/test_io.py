@@ -7,6 +7,7 @@ from pathlib import Path
 import numpy as np
 from skimage.io import imsave
 import tempfile
+import pytest
 
 from skued import diffread, dmread, imibread, mibheader, mibread
 from skued.utils import suppress_warnings
@@ -115,3 +116,27 @@ def test_mibread_multi():
     arr = mibread(TEST_MIB_MULTI)
     assert arr.shape == (256, 256, 9)
     assert arr.dtype == np.dtype(">u1")
+    assert arr.flags.c_contiguous
+
+
+def test_mibread_native_byteorder():
+    """Test that mibread() returns images in native byte order, regardless of the file format"""
+    arr = mibread(TEST_MIB)
+    assert arr.dtype.isnative
+    assert np.array_equal(arr, next(imibread(TEST_MIB)))
+
+
+def test_mibread_truncated():
+    """Test that mibread() raises an exception for a file with an incomplete last image"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        truncated = Path(tmpdir) / "truncated.mib"
+        truncated.write_bytes(TEST_MIB_MULTI.read_bytes()[:-1000])
+        with pytest.raises(ValueError):
+            mibread(truncated)
+
+
+def test_imibread_multi():
+    """Test that the generator version of mibread() yields the same images as mibread()"""
+    images = list(imibread(TEST_MIB_MULTI))
+    assert len(images) == 9
+    assert np.array_equal(np.dstack(images), mibread(TEST_MIB_MULTI))
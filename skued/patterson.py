@@ -4,6 +4,8 @@ Patterson pair-correlation function for polycrystalline diffraction patterns
 ============================================================================
 """
 
+from collections import Counter
+
 import numpy as np
 
 from .simulation import affe
@@ -38,7 +40,9 @@ def patterson(q, I, crystal, radii):
     """
     q, I, radii = tuple(map(lambda arr: np.asarray(arr, dtype=float), [q, I, radii]))
 
-    normalization = sum(np.square(affe(atm, q)) for atm in crystal)
+    # Form factors only depend on the element, so they are computed once per species
+    multiplicities = Counter(atm.element for atm in crystal)
+    normalization = sum(count * np.square(affe(element, q)) for element, count in multiplicities.items())
     reduced_intensity = I / normalization
 
     # We employ the outer product to avoid loops
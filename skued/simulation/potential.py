@@ -62,16 +62,15 @@ def electrostatic(crystal, x, y, z):
 
     potential = np.zeros_like(x, dtype=float)
     r = np.zeros_like(x, dtype=float)
+    lattice = np.array(crystal.lattice_vectors)
     for atom in crystal:
         ax, ay, az = atom.coords_cartesian
-        r[:] = minimum_image_distance(x - ax, y - ay, z - az, lattice=crystal.lattice_vectors)
+        r[:] = minimum_image_distance(x - ax, y - ay, z - az, lattice=lattice)
         potential += _electrostatic_atom(atom, r)
 
     # Due to sampling, x,y, and z might pass through the center of atoms
     # Replace np.inf by the next largest value
-    m = potential[np.isfinite(potential)].max()
-    potential[np.isinf(potential)] = m
-    return potential
+    return _clip_singularities(potential)
 
 
 def _pelectrostatic_atom(atom, r):
@@ -80,9 +79,14 @@ def _pelectrostatic_atom(atom, r):
     except KeyError:
         raise ValueError(f"Scattering information for element {atom.element} is unavailable.")
 
+    # Quantities which do not depend on the scattering parameters
+    # are computed once, rather than for every term of the sum
+    twopi_r = 2 * pi * r
+    pi2_r2 = np.square(pi * r)
+
     potential = np.zeros_like(r, dtype=float)
     for a, b, c, d in zip((a1, a2, a3), (b1, b2, b3), (c1, c2, c3), (d1, d2, d3)):
-        potential += 2 * a * bessel(2 * pi * r * sqrt(b)) + (c / d) * np.exp(-((r * pi) ** 2) / d)
+        potential += 2 * a * bessel(sqrt(b) * twopi_r) + (c / d) * np.exp(-pi2_r2 / d)
 
     return 2 * a0 * e * (pi**2) * potential
 
@@ -131,7 +135,17 @@ def pelectrostatic(crystal, x, y, bounds=None):
         potential += _pelectrostatic_atom(atom, r)
 
     # Due to sampling, x,y, and z might pass through the center of atoms
-    # Replace n.inf by the next largest value
-    potential[np.isinf(potential)] = np.nan
-    potential[np.isnan(potential)] = np.nanmax(potential)
+    # Replace np.inf by the next largest value
+    return _clip_singularities(potential)
+
+
+def _clip_singularities(potential):
+    """
+    Replace non-finite values of a potential, in-place, by the largest finite value.
+    Only a single boolean mask the size of the potential is allocated.
+    """
+    mask = np.isfinite(potential)
+    largest = np.max(potential, where=mask, initial=-np.inf)
+    np.logical_not(mask, out=mask)
+    np.copyto(potential, largest, where=mask)
     return potential
@@ -5,8 +5,6 @@ Polycrystalline diffraction pattern simulation
 """
 import numpy as np
 
-from crystals.affine import change_basis_mesh
-
 from ..voigt import pseudo_voigt
 from .structure_factors import structure_factor
 
@@ -32,8 +30,8 @@ def powdersim(crystal, q, fwhm_g=0.03, fwhm_l=0.06, **kwargs):
     """
     refls = np.vstack(tuple(crystal.bounded_reflections(q.max())))
     h, k, l = np.hsplit(refls, 3)
-    Gx, Gy, Gz = change_basis_mesh(h, k, l, basis1=crystal.reciprocal_vectors, basis2=np.eye(3))
-    qs = np.sqrt(Gx**2 + Gy**2 + Gz**2)
+    # All scattering vectors are computed at once from the (N,3) table of reflections
+    qs = np.linalg.norm(crystal.scattering_vector(refls), axis=1)
     intensities = np.absolute(structure_factor(crystal, h, k, l)) ** 2
 
     pattern = np.zeros_like(q)
@@ -3,10 +3,11 @@
 Structure Factor calculation
 """
 
-import numpy as np
+from collections import Counter
 
-from crystals.affine import change_basis_mesh
+import numpy as np
 
+from ..affine import change_basis_mesh
 from .form_factors import affe
 
 
@@ -39,7 +40,7 @@ def structure_factor(crystal, h, k, l, normalized=False):
     # This works whether G is a list of 3 numbers, a ndarray shape(3,) or
     # a list of meshgrid arrays.
     h, k, l = np.atleast_1d(h, k, l)
-    Gx, Gy, Gz = change_basis_mesh(h, k, l, basis1=crystal.reciprocal_vectors, basis2=np.eye(3))
+    Gx, Gy, Gz = change_basis_mesh(h, k, l, basis1=crystal.reciprocal_vectors)
     nG = np.sqrt(Gx**2 + Gy**2 + Gz**2)
 
     # Separating the structure factor into sine and cosine parts avoids adding
@@ -65,6 +66,9 @@ def structure_factor(crystal, h, k, l, normalized=False):
     SF = SFcos + 1j * SFsin
 
     if normalized:
-        SF /= np.sqrt(sum(atomff_dict[atom.element] ** 2 for atom in crystal))
+        # Atoms of the same element share a form factor; weigh by multiplicity
+        # rather than summing over every atom of the unit cell
+        multiplicities = Counter(atom.element for atom in crystal)
+        SF /= np.sqrt(sum(count * atomff_dict[element] ** 2 for element, count in multiplicities.items()))
 
     return SF
@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
 
-from copy import deepcopy
-
 import numpy as np
 
 from crystals import Crystal
@@ -53,3 +51,11 @@ def test_trivial():
     xx, yy = np.meshgrid(np.linspace(-10, 10, 32), np.linspace(-10, 10, 32))
     potential = pelectrostatic(crystal, xx, yy, bounds=(0, 1))
     assert np.allclose(potential, 0)
+
+
+def test_singularities():
+    """Test that the potential is finite everywhere, even at the position of atoms"""
+    crystal = Crystal.from_database("C")
+    xx, yy = np.meshgrid(np.linspace(0, 10, 32), np.linspace(0, 10, 32))
+    potential = pelectrostatic(crystal, xx, yy)
+    assert np.all(np.isfinite(potential))
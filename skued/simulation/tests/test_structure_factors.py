@@ -52,3 +52,17 @@ def test_shape_and_dtype():
 
     assert sf.shape == h.shape
     assert sf.dtype == complex
+
+
+def test_normalized():
+    """Test that the normalized structure factor is scaled by the form factors of every atom"""
+    crystal = Crystal.from_database("vo2-m1")
+    h, k, l = np.meshgrid([1, 2, 3], [1, 2, 3], [1, 2, 3])
+    sf = structure_factor(crystal, h, k, l)
+    sf_norm = structure_factor(crystal, h, k, l, normalized=True)
+
+    G = crystal.scattering_vector(np.stack([h.ravel(), k.ravel(), l.ravel()], axis=1))
+    nG = np.linalg.norm(G, axis=1).reshape(h.shape)
+    normalization = np.sqrt(sum(affe(atom, nG) ** 2 for atom in crystal))
+
+    assert np.allclose(sf_norm, sf / normalization)
@@ -72,6 +72,13 @@ def test_change_of_basis_trivial():
     assert np.allclose(cob, np.eye(3))
 
 
+def test_standard_basis_read_only():
+    """Test that the standard basis vectors, shared as default arguments, cannot be modified"""
+    for vector in (tr.e1, tr.e2, tr.e3):
+        with pytest.raises(ValueError):
+            vector[0] = 2
+
+
 def test_change_of_basis():
     """Test that change_of_basis() returns a correct change-of-basis matrix"""
 
@@ -84,6 +91,34 @@ def test_change_of_basis():
     assert np.allclose(np.dot(cob, b1), b2)
 
 
+def test_change_of_basis_no_shared_memory():
+    """Test that change_of_basis() returns a new array, even for the default basis"""
+    basis = np.random.random((3, 3))
+    for cob in (tr.change_of_basis(basis), tr.change_of_basis(basis, np.eye(3))):
+        assert not np.shares_memory(cob, basis)
+
+
+def test_change_of_basis_invalid_basis():
+    """Test that change_of_basis() raises an exception for inputs that are not three vectors"""
+    with pytest.raises(ValueError):
+        tr.change_of_basis(list(range(9)))
+
+    with pytest.raises(ValueError):
+        tr.change_of_basis(np.eye(3), np.eye(2))
+
+
+def test_change_of_basis_round_trip():
+    """Test that change_of_basis() matrices between two bases are inverses of each other,
+    for many vectors at once"""
+    b1 = np.random.random((3, 3)) + np.eye(3)
+    b2 = np.random.random((3, 3)) + np.eye(3)
+    vectors = np.random.uniform(-10, 10, size=(3, 1000))
+
+    forward = tr.change_of_basis(b1, b2)
+    backward = tr.change_of_basis(b2, b1)
+    assert np.allclose(np.dot(backward, np.dot(forward, vectors)), vectors)
+
+
 def test_is_basis():
     """Test that is_basis() correctly identifies that a
         basis of zeros is not a basis and that the standard
@@ -185,3 +220,53 @@ def test_change_basis_mesh_scaling():
     assert np.allclose(2 * xx, XX)
     assert np.allclose(2 * yy, YY)
     assert np.allclose(2 * zz, ZZ)
+
+
+def test_minimum_image_distance_orthorhombic():
+    """Test that minimum_image_distance() wraps coordinates back into the unit cell"""
+    lattice = np.diag([2, 3, 4])
+    xx, yy, zz = np.random.uniform(-10, 10, size=(3, 16, 16))
+
+    r = tr.minimum_image_distance(xx, yy, zz, lattice=lattice)
+
+    dx, dy, dz = (
+        xx - 2 * np.rint(xx / 2),
+        yy - 3 * np.rint(yy / 3),
+        zz - 4 * np.rint(zz / 4),
+    )
+    assert r.shape == xx.shape
+    assert np.allclose(r, np.sqrt(dx**2 + dy**2 + dz**2))
+
+
+def test_minimum_image_distance_invalid_lattice():
+    """Test that minimum_image_distance() raises an exception for a lattice that is not three vectors"""
+    xx, yy, zz = np.random.uniform(-10, 10, size=(3, 16, 16))
+    with pytest.raises(ValueError):
+        tr.minimum_image_distance(xx, yy, zz, lattice=list(range(9)))
+
+
+def test_change_basis_mesh_default_basis():
+    """Test that change_basis_mesh() expresses the mesh in the standard basis by default"""
+    extent = np.linspace(0, 10, 10, dtype=int)
+    xx, yy, zz = np.meshgrid(extent, extent, extent)
+    basis = np.random.random((3, 3))
+
+    XX, YY, ZZ = tr.change_basis_mesh(xx=xx, yy=yy, zz=zz, basis1=basis)
+    XX2, YY2, ZZ2 = tr.change_basis_mesh(xx=xx, yy=yy, zz=zz, basis1=basis, basis2=np.eye(3))
+    assert np.allclose(XX, XX2)
+    assert np.allclose(YY, YY2)
+    assert np.allclose(ZZ, ZZ2)
+
+
+def test_change_basis_mesh_sparse():
+    """Test that change_basis_mesh() supports sparse meshes, such as produced by numpy.ogrid"""
+    xs, ys, zs = np.ogrid[0:10, 0:5, 0:3]
+    xx, yy, zz = np.broadcast_arrays(xs, ys, zs)
+    basis = np.random.random((3, 3))
+
+    XX, YY, ZZ = tr.change_basis_mesh(xx=xs, yy=ys, zz=zs, basis1=basis)
+    XX2, YY2, ZZ2 = tr.change_basis_mesh(xx=xx, yy=yy, zz=zz, basis1=basis)
+    assert XX.shape == YY.shape == ZZ.shape == xx.shape
+    assert np.allclose(XX, XX2)
+    assert np.allclose(YY, YY2)
+    assert np.allclose(ZZ, ZZ2)